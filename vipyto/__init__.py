@@ -43,14 +43,34 @@ to print rich text to the console:
 import os
 from importlib.metadata import version
 
-from rich import pretty
-from rich.console import Console
-
-console = Console()
-print = console.print
-log = console.log
-status = console.status
-pretty.install()
+_console = None
+
+
+def _get_console():
+    """
+    Create the shared ``rich`` console on first use, so that importing
+    ``vipyto`` does not import ``rich``.
+
+    :meta private:
+    """
+    global _console
+    if _console is None:
+        from rich import pretty
+        from rich.console import Console
+
+        _console = Console()
+        pretty.install()
+    return _console
+
+
+def __getattr__(name):
+    # resolve console, print, log and status lazily
+    if name == "console":
+        return _get_console()
+    if name in {"print", "log", "status"}:
+        return getattr(_get_console(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 os.environ["PYTHONBREAKPOINT"] = "ipdb.set_trace"
 
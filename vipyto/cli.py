@@ -4,8 +4,8 @@ Command-line intereface for ``vipyto``.
 Currently, the following commands are available:
 
 - ``vipyto docs init``: Initialize the docs for your project using Sphinx
-- ``vipyto docs build``: Build the docs for your project (running ``make html``
-    in the docs folder for you)
+- ``vipyto docs build``: Build the docs for your project (running
+    :py:const:`~vipyto.docs.SPHINX_BUILD` in the docs folder for you)
 
 
 .. note::
@@ -13,14 +13,18 @@ Currently, the following commands are available:
     ``vipyto docs init`` will install packages if they are not already installed,
     like ``sphinx`` and Sphinx extensions. You can find the list of packages in
     :py:const:`~vipyto.docs.REQS`.
+
+.. note::
+
+    ``vipyto docs build`` keeps Sphinx's doctrees in ``docs/_build/.doctrees``
+    so that subsequent builds are incremental. Cache that folder in your CI
+    to benefit from it there too.
 """
 import subprocess
 
 import typer
 
-from vipyto import log, status
-from vipyto.cmd import run_command
-from vipyto.docs import init_docs
+from vipyto.cmd import run_command_check
 from vipyto.path import get_git_root
 
 app = typer.Typer()
@@ -47,6 +51,8 @@ def run_init_docs():
     """
     Command-line interface for initializing the docs for a project.
     """
+    from vipyto.docs import init_docs
+
     init_docs()
 
 
@@ -58,15 +64,18 @@ def build_docs():
     """
     Command-line interface for building your project's docs.
     """
+    from vipyto import log
+    from vipyto.docs import SPHINX_BUILD
+
     root = get_git_root()
     docs = root / "docs"
-    with status("Running `make html` in {}".format(docs)):
-        try:
-            run_command("make html", cwd=docs)
-        except subprocess.CalledProcessError as e:
-            log(str(e))
-            log("Failed to build docs", style="bold red")
-            raise typer.Exit(1)
+    log("Running `sphinx-build` in {}".format(docs))
+    try:
+        run_command_check(SPHINX_BUILD, cwd=docs)
+    except subprocess.CalledProcessError as e:
+        log(str(e))
+        log("Failed to build docs", style="bold red")
+        raise typer.Exit(1)
     log(
         f"Successfully built docs. Open {docs / '_build/html/index.html'} to see them",
         style="green",
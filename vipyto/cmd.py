@@ -1,25 +1,76 @@
 """
 Command-line interface utilities.
 
-Essentially, this module provides a wrapper around :py:func:`subprocess.check_output`.
+Essentially, this module provides wrappers around :py:func:`subprocess.check_output`
+and :py:func:`subprocess.check_call`.
 
 .. code-block:: python
 
-    from vipyto.cmd import run_command
+    from vipyto.cmd import run_command, run_command_check
 
     current_git_user = run_command("git config user.name")
 
+    # output is not captured, only the exit status is checked
+    run_command_check("make html", cwd="docs")
+
 """
 
+import functools
+import shlex
 import subprocess
 
 
+def _to_argv(command):
+    """
+    Split a command string into a list of arguments with :py:func:`shlex.split`.
+    Lists are returned as is.
+
+    :meta private:
+    """
+    if isinstance(command, str):
+        return shlex.split(command)
+    return list(command)
+
+
 def run_command(command, cwd=None):
     """
     Run a shell command and return the output.
 
     Args:
-        command (str): Command to run.
+        command (str|list[str]): Command to run, as a string (split with
+            :py:func:`shlex.split`) or as a list of arguments.
         cwd (str, optional): Directory to run the command in. Defaults to None.
     """
-    return subprocess.check_output(command.split(" "), cwd=cwd).decode("utf-8").strip()
+    return subprocess.check_output(_to_argv(command), cwd=cwd).decode("utf-8").strip()
+
+
+def run_command_check(command, cwd=None):
+    """
+    Run a shell command without capturing its output, which is streamed to the
+    terminal instead.
+
+    Use this instead of :py:func:`~vipyto.cmd.run_command` when only the exit
+    status matters.
+
+    Args:
+        command (str|list[str]): Command to run, as a string (split with
+            :py:func:`shlex.split`) or as a list of arguments.
+        cwd (str, optional): Directory to run the command in. Defaults to None.
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits with a non-zero status.
+    """
+    subprocess.check_call(_to_argv(command), cwd=cwd)
+
+
+@functools.lru_cache(maxsize=1)
+def get_git_user_name():
+    """
+    Get the current git user name from ``git config user.name``.
+
+    The result is cached so ``git`` is only called once per process.
+
+    Returns:
+        str: The git user name.
+    """
+    return run_command("git config user.name")
@@ -13,8 +13,8 @@ Its main function is :py:func:`~vipyto.docs.init_docs`, which does the following
 - Creates a ``.readthedocs.yml`` file with the configuration required by
     readthedocs.io
 - Creates a ``docs/index.rst`` file (which includes your README.md by default)
-- Installs the packages required to build the docs (starting with ``sphinx``
-    if it is not already installed)
+- Installs the packages required to build the docs (in a single ``pip``
+    call, only if some of them are missing)
 
 Importantly, it sets up ``autoapi`` to document your code automatically from its
 existing docstrings. This means that you don't need to write any additional
@@ -34,14 +34,44 @@ import re
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as get_version
 from textwrap import dedent
 
-from vipyto import log, status
-from vipyto.cmd import run_command
+from vipyto import log
+from vipyto.cmd import get_git_user_name, run_command_check
 from vipyto.path import get_git_root
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+_VERSION_RE = re.compile(r"^\s*version\s*=\s*(.+)$")
+"""
+Matches the ``version = ...`` line of a ``pyproject.toml`` file.
+
+:meta private:
+"""
+
+_EXTS_RE = re.compile(r"^extensions = \[.*?^\]", re.MULTILINE | re.DOTALL)
+"""
+Matches the ``extensions`` list of a ``conf.py`` file.
+
+:meta private:
+"""
+
+_THEME_RE = re.compile(r"^html_theme =.*$", re.MULTILINE)
+"""
+Matches the ``html_theme`` line of a ``conf.py`` file.
+
+:meta private:
+"""
+
 PREAMBLE = """\
 import sys
 from pathlib import Path
@@ -205,6 +235,26 @@ Additional configuration that will be added to ``docs/conf.py`` by
 :meta private:
 """
 
+SPHINX_BUILD = [
+    "sphinx-build",
+    "-b",
+    "html",
+    "-j",
+    "auto",
+    "-d",
+    "_build/.doctrees",
+    ".",
+    "_build/html",
+]
+"""
+Command used to build the html docs from the ``docs/`` folder, using as many
+processes as there are cpus (``-j auto``).
+
+Doctrees are stored in ``docs/_build/.doctrees`` and never wiped, so Sphinx only
+re-reads the sources that changed since the last build. Cache this folder in
+your CI to get incremental builds there too.
+"""
+
 INDEX = """\
 .. include:: ../README.md
    :parser: myst_parser.sphinx_
@@ -224,6 +274,97 @@ Default contents for ``docs/index.rst`` that will be created by
 """
 
 
+def _update_conf(text, project):
+    """
+    Customize the ``conf.py`` generated by ``sphinx-quickstart``: overwrite the
+    extensions and the theme, add the custom css file and the
+    :py:const:`~vipyto.docs.PREAMBLE`, and append the
+    :py:const:`~vipyto.docs.CONFIGS`.
+
+    Args:
+        text (str): Contents of ``conf.py``.
+        project (str): Name of the project, used in ``autoapi_dirs``.
+
+    Returns:
+        str: The updated contents of ``conf.py``.
+    """
+    text = _EXTS_RE.sub(lambda m: EXTS.rstrip("\n"), text, count=1)
+    text = _THEME_RE.sub('html_theme = "furo"', text)
+    text = text.replace(
+        "html_static_path = ['_static']",
+        "html_static_path = ['_static']\n" + 'html_css_files = ["css/custom.css"]',
+    )
+    idx = text.find("# -- General configuration")
+    if idx >= 0:
+        text = text[:idx] + PREAMBLE + "\n" + text[idx:]
+    return text + "\n" + CONFIGS.replace("$PROJECT", project)
+
+
+def _write(file):
+    """
+    Write a file's contents, or only create it if its contents are ``None``.
+
+    Args:
+        file (tuple[Path, str|None]): Path to the file and its contents.
+    """
+    path, content = file
+    if content is None:
+        path.touch()
+    else:
+        path.write_text(content)
+
+
+def _docs_requirements_installed():
+    """
+    Check whether all the packages in :py:const:`~vipyto.docs.REQS` are
+    installed.
+
+    Looks up the distributions' metadata so that nothing is imported.
+
+    Returns:
+        bool: Whether the docs requirements are installed.
+    """
+    for name in REQS.split():
+        try:
+            get_version(name)
+        except PackageNotFoundError:
+            return False
+    return True
+
+
+def _read_pyproject_version(pyproject):
+    """
+    Read a project's version from its ``pyproject.toml`` file.
+
+    Looks for ``[project].version`` then ``[tool.poetry].version``. The file is
+    parsed with ``tomllib`` (or ``tomli`` on Python < 3.11) and only scanned
+    line by line if neither is available.
+
+    Args:
+        pyproject (Path): Path to the ``pyproject.toml`` file.
+
+    Returns:
+        str: The project's version, or ``"0.1.0"`` if none is found.
+    """
+    text = pyproject.read_text()
+    if tomllib is not None:
+        try:
+            data = tomllib.loads(text)
+        except tomllib.TOMLDecodeError:
+            data = None
+        if data is not None:
+            return (
+                data.get("project", {}).get("version")
+                or data.get("tool", {}).get("poetry", {}).get("version")
+                or "0.1.0"
+            )
+    for line in text.split("\n"):
+        m = _VERSION_RE.match(line)
+        if m:
+            return m.group(1).strip().strip('"').strip("'")
+    return "0.1.0"
+
+
 def init_docs():
     """
     Initialize the Sphinx docs for a project with a selection of extensions.
@@ -241,17 +382,12 @@ def init_docs():
     """
     root = get_git_root()
     project = root.name
-    author = run_command("git config user.name")
+    author = get_git_user_name()
     try:
         version = get_version(project)
     except PackageNotFoundError:
         try:
-            pyproject = root / "pyproject.toml"
-            lines = pyproject.read_text().split("\n")
-            for line in lines:
-                if re.match(r"version\s?=\s?.+", line):
-                    version = line.split("=")[1].strip().strip('"').strip("'")
-                    break
+            version = _read_pyproject_version(root / "pyproject.toml")
         except FileNotFoundError:
             version = "0.1.0"
 
@@ -263,75 +399,63 @@ def init_docs():
 
     log(f"Initializing docs for {project} version {version} and author {author}")
     (root / "docs").mkdir(exist_ok=True)
-    command = " ".join(
-        [
-            f"sphinx-quickstart -q -p {project} -a {author} -v {version}",
-            "--no-sep --ext-autodoc --ext-viewcode --ext-todo --ext-mathjax",
-            "--ext-intersphinx --makefile",
-            "docs/",
-        ]
-    )
-    try:
-        import sphinx  # noqa: F401
-    except ImportError:
-        with status("Sphinx is not installed. Installing it now..."):
-            run_command(f"{sys.executable} -m pip install --upgrade pip")
-            run_command(f"{sys.executable} -m pip install sphinx")
-    with status("Running sphinx-quickstart..."):
-        run_command(command)
+    argv = [
+        "sphinx-quickstart",
+        "-q",
+        "-p",
+        project,
+        "-a",
+        author,
+        "-v",
+        version,
+        "--no-sep",
+        "--ext-autodoc",
+        "--ext-viewcode",
+        "--ext-todo",
+        "--ext-mathjax",
+        "--ext-intersphinx",
+        "--makefile",
+        "docs/",
+    ]
+    reqs = root / "docs" / "requirements-docs.txt"
+    reqs.write_text(REQS)
+    if not _docs_requirements_installed():
+        log("Installing docs dependencies...")
+        run_command_check(
+            [sys.executable, "-m", "pip", "install", "--upgrade", "pip"]
+            + ["-r", str(reqs)]
+        )
+    log("Running sphinx-quickstart...")
+    run_command_check(argv)
 
     conf = root / "docs" / "conf.py"
-    lines = conf.read_text().split("\n")
-    new_lines = []
-    is_exts = False
-    for line in lines:
-        if line == "extensions = [":
-            is_exts = True
-
-        if line.startswith("html_theme ="):
-            line = 'html_theme = "furo"'
-
-        if line == "html_static_path = ['_static']":
-            line += "\n" + 'html_css_files = ["css/custom.css"]'
-
-        if "# -- General configuration" in line:
-            line = PREAMBLE + "\n" + line
-
-        # store
-        if not is_exts:
-            new_lines.append(line)
-
-        if is_exts and line == "]":
-            is_exts = False
-            new_lines.append(EXTS)
-    new_lines.append(CONFIGS.replace("$PROJECT", project))
-    conf.write_text("\n".join(new_lines))
-    (root / "docs" / "requirements-docs.txt").write_text(REQS)
-    (root / ".readthedocs.yml").write_text(RTD_CONF)
+    conf_text = _update_conf(conf.read_text(), project)
     (root / "docs" / "_static" / "css").mkdir(exist_ok=True)
     (root / "docs" / "_static" / "images").mkdir(exist_ok=True)
-    (root / "docs" / "_static" / "css" / "custom.css").touch()
-    (root / "docs" / "index.rst").write_text(INDEX)
-
-    with status("Installing docs dependencies..."):
-        run_command(f"{sys.executable} -m pip install --upgrade pip")
-        run_command(f"{sys.executable} -m pip install -r docs/requirements-docs.txt")
-
-    with status("Running `cd docs && make html` to build the docs"):
-        try:
-            run_command("make html", cwd=str(root / "docs"))
-            log("Your docs were built successfully!", style="green")
-            log("See them by openning `docs/_build/html/index.html` in your browser.")
-        except subprocess.CalledProcessError:
-            log(
-                dedent(
-                    f"""\
-                Docs building error.
-                The docs were built assuming your project is called `{project}`.
-                If your code is in an other folder, this may be why the build failed.
-                In that case, update docs/conf.py (line: `autoapi_dirs = `).
-                """
-                ),
-                style="orange_red1",
-            )
-    log("Run `make html` in the `docs/` folder to build the docs yourself.")
+    files = [
+        (conf, conf_text),
+        (root / ".readthedocs.yml", RTD_CONF),
+        (root / "docs" / "_static" / "css" / "custom.css", None),
+        (root / "docs" / "index.rst", INDEX),
+    ]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_write, files))
+
+    log("Running `sphinx-build` in docs/ to build the docs")
+    try:
+        run_command_check(SPHINX_BUILD, cwd=str(root / "docs"))
+        log("Your docs were built successfully!", style="green")
+        log("See them by openning `docs/_build/html/index.html` in your browser.")
+    except subprocess.CalledProcessError:
+        log(
+            dedent(
+                f"""\
+            Docs building error.
+            The docs were built assuming your project is called `{project}`.
+            If your code is in an other folder, this may be why the build failed.
+            In that case, update docs/conf.py (line: `autoapi_dirs = `).
+            """
+            ),
+            style="orange_red1",
+        )
+    log("Run `vipyto docs build` to build the docs yourself.")
@@ -35,34 +35,118 @@ A few utilities to manipulate paths.
 
     Functions refer to ``[...]_git_[...]`` because this is how the root path
     is determined: it is the **first** folder that contains a ``.git`` folder
-    when going up the directory tree from the current working directory.
+    (or file) when going up the directory tree from the current working
+    directory or, if there is none, the work tree root reported by
+    ``git rev-parse --show-toplevel``.
 
 """
 
 import os
+import subprocess
 import sys
 from pathlib import Path
 
+_ROOT_CACHE = {}
+"""
+Maps a directory (as a string) to the git root it resolves to (``Path`` or
+``None``). Populated by :py:func:`~vipyto.path.get_git_root` for every folder
+visited while going up the directory tree.
 
-def get_git_root():
+:meta private:
+"""
+
+
+def _git_toplevel(cwd):
     """
-    Recursively finds the root directory of a git repository.
+    Asks ``git`` for the root of the work tree containing ``cwd``.
+
+    Args:
+        cwd (str): Directory to run ``git rev-parse --show-toplevel`` in.
+
+    Returns:
+        Path|None: The work tree root, or None if ``git`` is not available or
+        ``cwd`` is not in a work tree.
+    """
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            capture_output=True,
+            text=True,
+            cwd=cwd,
+        )
+    except OSError:
+        return None
+    toplevel = out.stdout.strip()
+    if out.returncode != 0 or not toplevel:
+        return None
+    return Path(toplevel)
+
+
+def _find_git_root(cwd):
+    """
+    Finds the root of the git repository containing ``cwd``.
+
+    Walks up the directory tree from ``cwd`` until it finds a folder containing
+    ``.git`` (a folder, or a file for worktrees and submodules) or a folder
+    already in ``_ROOT_CACHE``. Only if neither is found is
+    ``git rev-parse --show-toplevel`` called, which handles ``GIT_WORK_TREE``.
+
+    Every directory visited on the way up is stored in ``_ROOT_CACHE`` with the
+    resolved root so that later lookups from any of them (or from a descendant
+    reaching one of them) stop early.
+
+    Args:
+        cwd (str): Directory to start the search from.
 
     Returns:
         Path|None: Path to the root directory of the git repository or None.
     """
-    path = Path.cwd()
+    path = Path(cwd)
+    visited = []
     while path != path.parent:
-        if (path / ".git").is_dir():
-            return path
+        key = str(path)
+        if key in _ROOT_CACHE:
+            root = _ROOT_CACHE[key]
+            break
+        visited.append(key)
+        if (path / ".git").exists():
+            root = path
+            break
         path = path.parent
-    return None
+    else:
+        root = _git_toplevel(cwd)
+        if root is not None:
+            # only the directories inside the work tree resolve to it
+            visited = [key for key in visited if Path(key).is_relative_to(root)]
+    for key in visited:
+        _ROOT_CACHE[key] = root
+    return root
+
+
+def get_git_root():
+    """
+    Recursively finds the root directory of a git repository.
+
+    Results are cached for the current working directory and all its parents
+    up to the root, so repeated calls don't walk the directory tree again.
+    Use ``get_git_root.cache_clear()`` to reset the cache.
+
+    Returns:
+        Path|None: Path to the root directory of the git repository or None.
+    """
+    cwd = os.getcwd()
+    if cwd in _ROOT_CACHE:
+        return _ROOT_CACHE[cwd]
+    return _find_git_root(cwd)
+
+
+get_git_root.cache_clear = _ROOT_CACHE.clear
 
 
 def add_git_root_to_path(verbose=False):
     """
     Recursively finds the root directory of a git repository
-    and adds it to the path.
+    and adds it to the front of the path, if it is not already in it.
 
     Args:
         verbose (bool): Print the path that is added to the path.
@@ -71,11 +155,16 @@ def add_git_root_to_path(verbose=False):
     if not root:
         if verbose:
             print("No git root found")
+        return
+
+    root = str(root)
+    if root in sys.path:
+        return
 
     if verbose:
         print("Adding {} to path".format(root))
 
-    sys.path.append(str(root))
+    sys.path.insert(0, root)
 
 
 def resolve(path):
@@ -3,7 +3,9 @@ Training utilities for PyTorch deep learning code.
 
 .. warning::
 
-    Requires torch and numpy to be installed.
+    :py:func:`~vipyto.train.set_seeds` requires torch and numpy to be installed,
+    :py:func:`~vipyto.train.count_gpus` requires torch. They are imported when
+    those functions are called, not when ``vipyto.train`` is imported.
 
 For instance if you don't want to always manually match the number of workers
 in your dataloaders to the number of cpus available on your machine (for example
@@ -34,46 +36,188 @@ CPUs (divided by the number of GPUs if GPUs are available):
 
 """
 
+import functools
+import glob
 import os
+import random
 import re
 import subprocess
 
-from vipyto import print
 from vipyto.cmd import run_command
 from vipyto.path import resolve
 
-try:
-    import random
+_GRES_GPU_RE = re.compile(r"gpu(?::[^:,]+)?:(\d+)")
+"""
+Matches the number of gpus in a SLURM gres string: ``[gres/]gpu:N`` or
+``[gres/]gpu:type:N``, possibly followed by other resources or an ``(IDX:...)``
+suffix.
 
-    import numpy as np
-    import torch
+:meta private:
+"""
 
-except ImportError:
-    print(
-        "\n[bold red]💥 torch and numpy must be"
-        + " installed to use vipyto.train[/bold red]\n",
-    )
-    raise
+_SQUEUE_CACHE = {}
+"""
+Maps a SLURM job id (as a string) to its ``(cpus, gres)`` fields from ``squeue``.
+
+:meta private:
+"""
+
+_torch = None
+_np = None
+
+
+def _get_torch():
+    """
+    Import torch on first use and cache it.
 
+    :meta private:
+    """
+    global _torch
+    if _torch is None:
+        try:
+            import torch
+        except ImportError as e:
+            raise ImportError("torch must be installed to use this function") from e
+        _torch = torch
+    return _torch
+
+
+def _get_numpy():
+    """
+    Import numpy on first use and cache it.
 
-def set_seeds(seed=0):
+    :meta private:
     """
-    Set seeds for torch, random, numpy and cuda.
+    global _np
+    if _np is None:
+        try:
+            import numpy
+        except ImportError as e:
+            raise ImportError("numpy must be installed to use this function") from e
+        _np = numpy
+    return _np
+
+
+def set_seeds(seed=0, deterministic=True):
+    """
+    Set seeds for torch, random, numpy and cuda, and make cudnn deterministic.
+
+    Each generator gets its own seed, derived from ``seed`` with
+    :py:class:`numpy.random.SeedSequence` so that their streams are not
+    correlated. This also makes it safe to use ``seed + rank`` in distributed
+    training.
+
+    Also sets ``$PYTHONHASHSEED`` (for subprocesses) and
+    ``$CUBLAS_WORKSPACE_CONFIG`` (required by deterministic cuBLAS) if they are
+    not already set, and disables cudnn's benchmark mode.
 
     Args:
         seed (int, optional): Seed. Defaults to 0.
+        deterministic (bool, optional): Whether to also call
+            ``torch.use_deterministic_algorithms(True, warn_only=True)``, which
+            covers non-cudnn ops and warns when an op has no deterministic
+            implementation. Defaults to True.
     """
-    seed = 0
-    torch.manual_seed(seed)
-    random.seed(seed)
-    np.random.seed(seed)
-    torch.cuda.manual_seed_all(seed)
+    os.environ.setdefault("PYTHONHASHSEED", str(seed))
+    os.environ.setdefault("CUBLAS_WORKSPACE_CONFIG", ":4096:8")
+
+    np = _get_numpy()
+    torch = _get_torch()
+
+    s_torch, s_np, s_py, s_cuda = np.random.SeedSequence(seed).spawn(4)
+    cuda_seed = int(s_cuda.generate_state(1, dtype=np.uint64)[0])
+
+    torch.manual_seed(int(s_torch.generate_state(1, dtype=np.uint64)[0]))
+    random.seed(int.from_bytes(s_py.generate_state(4).tobytes(), "little"))
+    np.random.seed(s_np.generate_state(1)[0])
+    torch.cuda.manual_seed(cuda_seed)
+    torch.cuda.manual_seed_all(cuda_seed)
     torch.backends.cudnn.deterministic = True
+    torch.backends.cudnn.benchmark = False
+    if deterministic:
+        torch.use_deterministic_algorithms(True, warn_only=True)
+
+
+def _squeue_info(job_id):
+    """
+    Query SLURM for the cpus and generic resources (gpus) of a job with a single
+    ``squeue`` call. Results are cached per ``job_id`` in ``_SQUEUE_CACHE``,
+    which :py:func:`~vipyto.train.prefetch_slurm_info` can fill in advance.
+
+    Args:
+        job_id (str|int): SLURM job id.
+
+    Raises:
+        subprocess.CalledProcessError: If ``squeue`` fails.
+        OSError: If ``squeue`` cannot be run (for instance if it is not
+            installed).
+
+    Returns:
+        tuple[str, str]: The job's ``%c`` (cpus) and ``%b`` (gres) fields.
+
+    :meta private:
+    """
+    key = str(job_id)
+    if key not in _SQUEUE_CACHE:
+        out = run_command(f'squeue --job {job_id} -o "%c %b" --noheader')
+        cpus, _, gpus = out.strip().partition(" ")
+        _SQUEUE_CACHE[key] = (cpus, gpus.strip())
+    return _SQUEUE_CACHE[key]
+
+
+def prefetch_slurm_info(job_ids):
+    """
+    Query SLURM for the cpus and gpus of several jobs with a single ``squeue``
+    call, and cache the results for :py:func:`~vipyto.train.count_cpus` and
+    :py:func:`~vipyto.train.count_gpus`.
+
+    Call it once before counting resources for many jobs (for instance the
+    tasks of a job array) to avoid one ``squeue`` call per job.
+
+    Does nothing if ``squeue`` fails or is not installed: the counting functions
+    then fall back to their other sources.
+
+    Args:
+        job_ids (Iterable[str|int]): SLURM job ids.
+    """
+    job_ids = [str(j) for j in job_ids]
+    if not job_ids:
+        return
+    try:
+        out = run_command(
+            f'squeue --jobs={",".join(job_ids)} -o "%i %c %b" --noheader'
+        )
+    except (subprocess.CalledProcessError, OSError):
+        return
+    for line in out.split("\n"):
+        fields = line.split(None, 2)
+        if len(fields) < 2:
+            continue
+        job_id, cpus = fields[:2]
+        gpus = fields[2].strip() if len(fields) == 3 else ""
+        _SQUEUE_CACHE[job_id] = (cpus, gpus)
+    # counts computed before the prefetch may have fallen back to local info
+    _count_cpus.cache_clear()
+    _count_gpus.cache_clear()
+
+
+def _is_current_job(job_id):
+    """
+    Whether ``job_id`` is the SLURM job this process runs in, in which case
+    SLURM's environment variables describe it.
+
+    :meta private:
+    """
+    return str(job_id) == os.environ.get("SLURM_JOB_ID")
 
 
 def count_cpus(job_id=None):
     """
-    Count the number of cpus available on the system, parsing SLURM info if available.
+    Count the number of cpus this process can run on. If the process is not
+    restricted to a subset of the machine's cpus, parses SLURM info if available.
+    If ``job_id`` is not the job this process runs in, its cpus are read from
+    ``squeue``.
+    The result is cached per ``job_id``.
 
     Args:
         job_id (int, optional): SLURM_JOB_ID to count cpus for. Will be read
@@ -83,25 +227,120 @@ def count_cpus(job_id=None):
     Returns:
         int: Number of cpus available for this process.
     """
-    cpus = None
-    if job_id is None:
-        job_id = os.environ.get("SLURM_JOB_ID")
-    if job_id:
+    return _count_cpus(job_id or os.environ.get("SLURM_JOB_ID"))
+
+
+@functools.lru_cache(maxsize=8)
+def _count_cpus(job_id):
+    """
+    Cached implementation of :py:func:`~vipyto.train.count_cpus` for a resolved
+    ``job_id`` (which may be None).
+
+    :meta private:
+    """
+    cpus = _affinity_cpus()
+    cgroup_cpus = _cpus_from_cgroup()
+    if cgroup_cpus:
+        cpus = min(cpus, cgroup_cpus)
+    if job_id and not _is_current_job(job_id):
+        # this process' cpus say nothing about another job: ask SLURM
+        try:
+            return int(_squeue_info(job_id)[0])
+        except (subprocess.CalledProcessError, OSError, ValueError):
+            return cpus
+    if job_id and cpus >= (os.cpu_count() or cpus):
+        # the process is not restricted to a subset of cpus: ask SLURM
+        for var in ("SLURM_CPUS_PER_TASK", "SLURM_CPUS_ON_NODE"):
+            try:
+                return int(os.environ[var])
+            except (KeyError, ValueError):
+                pass
         try:
-            slurm_cpus = run_command(f"squeue --job {job_id} -o %c").split("\n")[1]
-            cpus = int(slurm_cpus)
-        except subprocess.CalledProcessError:
-            cpus = os.cpu_count()
+            cpus = int(_squeue_info(job_id)[0])
+        except (subprocess.CalledProcessError, OSError, ValueError):
+            pass
+
+    return cpus
+
+
+def _affinity_cpus():
+    """
+    Number of cpus this process may be scheduled on, which respects taskset and
+    cgroup restrictions unlike :py:func:`os.cpu_count`.
+
+    :meta private:
+    """
+    if hasattr(os, "process_cpu_count"):  # Python >= 3.13
+        cpus = os.process_cpu_count()
+    elif hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
     else:
         cpus = os.cpu_count()
+    return cpus or 1
 
+
+def _parse_cpu_list(text):
+    """
+    Parse a Linux cpu list like ``"0-3,8-11"`` into a list of cpu ids.
+
+    :meta private:
+    """
+    cpus = []
+    for part in text.strip().split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        cpus.extend(range(int(start), int(end or start) + 1))
     return cpus
 
 
+def _cpus_from_cgroup():
+    """
+    Number of cpus in this process' cgroup cpuset, read from ``/sys/fs/cgroup``
+    (cgroup v2 ``cpuset.cpus.effective`` or v1 ``cpuset/cpuset.cpus``).
+
+    Returns:
+        int|None: Number of cpus, or None if no cpuset could be read.
+
+    :meta private:
+    """
+    v2_path, v1_path = "/", "/"
+    try:
+        with open("/proc/self/cgroup") as f:
+            for line in f:
+                _, controllers, path = line.strip().split(":", 2)
+                if controllers == "":
+                    v2_path = path
+                elif "cpuset" in controllers.split(","):
+                    v1_path = path
+    except (OSError, ValueError):
+        pass
+
+    candidates = [
+        f"/sys/fs/cgroup{v2_path.rstrip('/')}/cpuset.cpus.effective",
+        "/sys/fs/cgroup/cpuset.cpus.effective",
+        f"/sys/fs/cgroup/cpuset{v1_path.rstrip('/')}/cpuset.cpus",
+        "/sys/fs/cgroup/cpuset/cpuset.cpus",
+    ]
+    for candidate in candidates:
+        try:
+            with open(candidate) as f:
+                cpus = _parse_cpu_list(f.read())
+        except (OSError, ValueError):
+            continue
+        if cpus:
+            return len(cpus)
+    return None
+
+
 def count_gpus(job_id=None):
     """
-    Count the number of gpus available on the system, parsing SLURM info if available.
-    Otherwise, returns the number of gpus available on the system according to torch.
+    Count the number of gpus available on the system according to
+    ``$CUDA_VISIBLE_DEVICES`` or, if it is not set, to torch. If no gpu is
+    found, parses SLURM info if available. If ``job_id`` is not the job this
+    process runs in, its gpus are read from ``squeue``.
+    The result is cached per ``job_id`` and ``$CUDA_VISIBLE_DEVICES``.
 
     Args:
         job_id (str|int, optional): SLURM_JOB_ID to count gpus for. Will be read
@@ -111,23 +350,88 @@ def count_gpus(job_id=None):
     Returns:
         int: Number of gpus available for this process.
     """
+    return _count_gpus(
+        job_id or os.environ.get("SLURM_JOB_ID"),
+        os.environ.get("CUDA_VISIBLE_DEVICES"),
+    )
+
+
+def _visible_gpus(cvd):
+    """
+    Number of gpus listed in ``$CUDA_VISIBLE_DEVICES``, which avoids initializing
+    the CUDA driver. As CUDA does, ignores devices after an invalid (negative)
+    id.
+
+    Args:
+        cvd (str|None): Value of ``$CUDA_VISIBLE_DEVICES``.
+
+    Returns:
+        int|None: Number of visible gpus, or None if the variable is not set.
+
+    :meta private:
+    """
+    if cvd is None:
+        return None
+    gpus = 0
+    for device in cvd.split(","):
+        device = device.strip()
+        if not device or device.startswith("-"):
+            break
+        gpus += 1
+    return gpus
+
+
+@functools.lru_cache(maxsize=1)
+def _torch_device_count():
+    """
+    ``torch.cuda.device_count()``, cached since it goes through the CUDA driver
+    and cannot change once CUDA is initialized.
+
+    :meta private:
+    """
+    return _get_torch().cuda.device_count()
+
+
+@functools.lru_cache(maxsize=8)
+def _count_gpus(job_id, cvd):
+    """
+    Cached implementation of :py:func:`~vipyto.train.count_gpus` for a resolved
+    ``job_id`` (which may be None) and ``$CUDA_VISIBLE_DEVICES`` value ``cvd``.
+
+    :meta private:
+    """
+    current = not job_id or _is_current_job(job_id)
     gpus = 0
-    if job_id is None:
-        job_id = os.environ.get("SLURM_JOB_ID")
+    if current:
+        # $CUDA_VISIBLE_DEVICES and torch only describe this process
+        gpus = _visible_gpus(cvd)
+        if gpus is None:
+            gpus = _torch_device_count()
+        if gpus > 0:
+            return gpus
+
     if job_id:
+        if current:
+            try:
+                return int(os.environ["SLURM_GPUS_ON_NODE"])
+            except (KeyError, ValueError):
+                pass
+            job_gpus = os.environ.get("SLURM_JOB_GPUS")
+            if job_gpus:
+                return len([g for g in job_gpus.split(",") if g.strip()])
         try:
-            slurm_gpus = run_command(f"squeue --job {job_id} -o %b").split("\n")[1]
-            gpus = re.findall(r".*(\d+)", slurm_gpus) or 0
-            gpus = int(gpus[0]) if gpus != 0 else gpus
-        except subprocess.CalledProcessError:
-            gpus = torch.cuda.device_count()
-    else:
-        gpus = torch.cuda.device_count()
+            slurm_gpus = _squeue_info(job_id)[1]
+        except (subprocess.CalledProcessError, OSError):
+            slurm_gpus = ""
+        match = _GRES_GPU_RE.search(slurm_gpus)
+        gpus = int(match.group(1)) if match else 0
 
     return gpus
 
 
-def get_num_workers_from_cpus(job_id=None, verbose=False):
+def get_num_workers_from_cpus(
+    job_id=None, verbose=False, pin_memory=False, device="cuda", cap=8
+):
     """
     Get the number of workers to use for a dataloader, based on the number of cpus
     available on the machine (reads SLURM info if available).
@@ -135,43 +439,236 @@ def get_num_workers_from_cpus(job_id=None, verbose=False):
     Number of workers is set to the number of cpus minus one if no gpus are available,
     or to the number of cpus divided by the number of gpus if gpus are available.
 
+    More workers is not always faster, so this number is then adjusted:
+
+    - It is 0 when training on cpu: workers would compete with the model for the
+      same cores.
+    - It is capped at ``cap``: beyond a handful of workers, throughput usually
+      stops increasing while memory usage and contention keep growing.
+    - It is reduced by one with ``pin_memory=True`` to leave a core to the
+      thread that copies batches to pinned memory.
+
     Args:
         job_id (int, optional): SLURM_JOB_ID to count cpus for. Will be read
             from the environment variable if none is provided. Is ignored if no
             SLURM info is available (on a local machine for instance). Defaults to None.
         verbose (bool, optional): Print the number of workers that will be used.
             Defaults to False.
+        pin_memory (bool, optional): Whether the dataloader uses
+            ``pin_memory=True``. Defaults to False.
+        device (str|torch.device, optional): Device the model is trained on,
+            like ``"cpu"``, ``"cuda:0"`` or a ``torch.device``. Defaults to
+            ``"cuda"``.
+        cap (int, optional): Maximum number of workers. ``None`` means no maximum.
+            Defaults to 8.
 
     Returns:
-        _type_: _description_
+        int: Number of workers to use.
     """
-    if job_id is None:
-        job_id = os.environ.get("SLURM_JOB_ID")
+    if str(device).split(":")[0] == "cpu":
+        if verbose:
+            from vipyto import print
+
+            print("Using 0 workers (training on cpu)")
+        return 0
+
+    job_id = job_id or os.environ.get("SLURM_JOB_ID")
     cpus = count_cpus(job_id)
     gpus = count_gpus(job_id)
-    if cpus is not None:
-        if gpus == 0:
-            workers = cpus - 1
-        else:
-            workers = cpus // gpus
+    if gpus == 0:
+        workers = cpus - 1
+    else:
+        workers = cpus // gpus
+    if cap is not None:
+        workers = min(cap, workers)
+    if pin_memory:
+        workers -= 1
+    workers = max(0, workers)
     if verbose:
+        from vipyto import print
+
         print(f"Using {workers} workers (cpus: {cpus}, gpus: {gpus})")
     return workers
 
 
+def _affinity_cores():
+    """
+    Sorted list of the cpu ids this process may be scheduled on.
+
+    :meta private:
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _numa_nodes():
+    """
+    Cpu ids of each NUMA node, read from ``/sys/devices/system/node``.
+
+    Returns:
+        list[list[int]]: Cpus of each node, sorted by node id. Empty if the
+        topology is not available (on non-Linux systems for instance).
+
+    :meta private:
+    """
+    nodes = []
+    for path in glob.glob("/sys/devices/system/node/node*/cpulist"):
+        node_id = os.path.basename(os.path.dirname(path)).replace("node", "", 1)
+        try:
+            with open(path) as f:
+                nodes.append((int(node_id), _parse_cpu_list(f.read())))
+        except (OSError, ValueError):
+            continue
+    return [cpus for _, cpus in sorted(nodes)]
+
+
+def get_worker_affinity_plan(job_id=None):
+    """
+    Plan which cpu cores dataloader workers should be pinned to.
+
+    The number of workers comes from
+    :py:func:`~vipyto.train.get_num_workers_from_cpus`. Each worker gets its own
+    core, skipping core 0 which the OS and the main process tend to use. The
+    remaining cores are left to the main process' compute threads.
+
+    On machines with several NUMA nodes, workers are taken from the first node
+    and compute threads from the other ones, so that workers and the main
+    process don't share the same memory controller.
+
+    ``threads_per_worker`` is the number of torch / OpenMP threads each worker
+    should use: the number of cores it is pinned to, i.e. 1. By default each
+    worker would use as many threads as there are cpus, so ``N`` workers would
+    start ``N * cpus`` threads competing for the same cores.
+
+    Args:
+        job_id (str|int, optional): SLURM_JOB_ID to count cpus and gpus for. Will
+            be read from the environment variable if none is provided.
+            Defaults to None.
+
+    Returns:
+        dict: ``{"num_workers": int, "worker_cores": list[int],
+        "compute_cores": list[int], "threads_per_worker": int,
+        "numa_nodes": list[list[int]]}``
+    """
+    job_id = job_id or os.environ.get("SLURM_JOB_ID")
+    cores = _affinity_cores()
+    allowed = set(cores)
+    nodes = []
+    for node in _numa_nodes():
+        node = [c for c in node if c in allowed]
+        if node:
+            nodes.append(node)
+    if not nodes:
+        nodes = [cores]
+    worker_node = [c for c in nodes[0] if c != 0] or nodes[0]
+    # workers first fill their node, then the others if it is too small
+    candidates = worker_node + [c for c in cores if c not in worker_node and c != 0]
+    num_workers = max(0, min(get_num_workers_from_cpus(job_id), len(candidates)))
+    worker_cores = candidates[:num_workers]
+    compute_cores = [c for node in nodes[1:] for c in node if c not in worker_cores]
+    if not compute_cores:
+        compute_cores = [c for c in cores if c not in worker_cores]
+    # each worker is pinned to a single core: more threads would only compete
+    threads_per_worker = 1
+    return {
+        "num_workers": num_workers,
+        "worker_cores": worker_cores,
+        "compute_cores": compute_cores,
+        "threads_per_worker": threads_per_worker,
+        "numa_nodes": nodes,
+    }
+
+
+def _pin_worker(worker_cores, threads_per_worker, worker_id):
+    """
+    Dataloader ``worker_init_fn`` built by
+    :py:func:`~vipyto.train.make_worker_init_fn`.
+
+    :meta private:
+    """
+    if worker_cores and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {worker_cores[worker_id % len(worker_cores)]})
+        # a single core: more threads would only compete for it
+        threads_per_worker = 1
+
+    _get_torch().set_num_threads(threads_per_worker)
+
+
+def make_worker_init_fn(worker_cores, threads_per_worker=1):
+    """
+    Make a ``worker_init_fn`` for a :py:class:`torch.utils.data.DataLoader` that
+    pins each worker to its own core and caps its number of torch threads
+    (with :py:func:`torch.set_num_threads`) to avoid thread oversubscription.
+
+    Workers are started before this function runs, so it cannot change
+    settings read at startup like ``$OMP_NUM_THREADS``: set those before
+    creating the ``DataLoader`` if you need them.
+
+    Pinning uses :py:func:`os.sched_setaffinity` and is skipped on platforms
+    that don't support it. The returned function can be pickled, so it works
+    with the ``spawn`` start method too.
+
+    .. code-block:: python
+
+        from vipyto.train import get_worker_affinity_plan, make_worker_init_fn
+
+        plan = get_worker_affinity_plan()
+        loader = DataLoader(
+            dataset,
+            num_workers=plan["num_workers"],
+            worker_init_fn=make_worker_init_fn(
+                plan["worker_cores"], plan["threads_per_worker"]
+            ),
+        )
+
+    Args:
+        worker_cores (list[int]): Cores to pin workers to, as returned by
+            :py:func:`~vipyto.train.get_worker_affinity_plan`.
+        threads_per_worker (int, optional): Number of torch threads per worker
+            when workers are not pinned. Pinned workers always use a single
+            thread since they run on a single core. Defaults to 1.
+
+    Returns:
+        Callable[[int], None]: The ``worker_init_fn``.
+    """
+    return functools.partial(_pin_worker, list(worker_cores), threads_per_worker)
+
+
 def slurm_tmpdir(job_id=None):
     """
     Returns the path to the slurm tmpdir if it exists, otherwise returns None.
     Useful if the $SLURM_TMPDIR is not guaranteed to exist.
 
+    Uses ``$SLURM_TMPDIR`` if it is set and ``job_id`` is the current job, and
+    ``/Tmp/slurm.{job_id}.0`` otherwise.
+    The result is cached per ``job_id``.
+
     Args:
-        job_id (str|int, optional): SLURM_JOB_ID to count gpus for. Will be read
+        job_id (str|int, optional): SLURM_JOB_ID to find the tmpdir of. Will be read
             from the environment variable if none is provided. Is ignored if no
             SLURM info is available (on a local machine for instance). Defaults to None.
 
     Returns:
-        Optional[str]: The path to the slurm tmpdir or None
+        Optional[Path]: The path to the slurm tmpdir or None
     """
-    job_id = job_id or os.environ.get("SLURM_JOB_ID")
-    if job_id is not None:
-        return resolve(f"/Tmp/slurm.{job_id}.0")
+    return _slurm_tmpdir(job_id or os.environ.get("SLURM_JOB_ID"))
+
+
+@functools.lru_cache(maxsize=8)
+def _slurm_tmpdir(job_id):
+    """
+    Cached implementation of :py:func:`~vipyto.train.slurm_tmpdir` for a resolved
+    ``job_id`` (which may be None).
+
+    :meta private:
+    """
+    if job_id and _is_current_job(job_id):
+        tmpdir = os.environ.get("SLURM_TMPDIR")
+        if tmpdir and os.path.isdir(tmpdir):
+            return resolve(tmpdir)
+    if job_id:
+        candidate = f"/Tmp/slurm.{job_id}.0"
+        if os.path.isdir(candidate):
+            return resolve(candidate)
+    return None